@@ -4,14 +4,22 @@ from bokeh.models import (
     TextInput, Select, Button, Div, 
     RadioButtonGroup, Slider, CheckboxGroup, 
     PreText, HoverTool, CrosshairTool, Span, Label,
-    Range1d
+    Range1d, ColumnDataSource, CDSView, BooleanFilter
 )
 from bokeh.plotting import figure
 from bokeh.themes import Theme
-import yfinance as yf
 import pandas as pd
 import numpy as np
-from datetime import datetime, timedelta
+from indicators import compute_indicators, extend_indicators, lttb_indices, INDICATOR_COLUMNS
+from shared import CACHE_TTL_SECONDS, cache_get, cache_put, download_executor
+from datetime import date, datetime, timedelta
+from functools import partial
+from operator import attrgetter
+import glob
+import os
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 import warnings
 warnings.filterwarnings('ignore')
 
@@ -166,6 +174,182 @@ THEME_COLORS = {
     }
 }
 
+# Figure properties colored by the theme, as property path -> THEME_COLORS key
+CHART_STYLE = {
+    "background_fill_color": "bg",
+    "border_fill_color": "bg",
+    "grid.grid_line_color": "grid",
+    "xaxis.major_label_text_color": "text",
+    "yaxis.major_label_text_color": "text",
+    "xaxis.axis_label_text_color": "text",
+    "yaxis.axis_label_text_color": "text",
+    "xaxis.axis_line_color": "text",
+    "yaxis.axis_line_color": "text",
+}
+MAIN_CHART_STYLE = {
+    **CHART_STYLE,
+    "title.text_color": "text",
+    "legend.background_fill_color": "widget_bg",
+    "legend.label_text_color": "text",
+    "legend.border_line_color": "grid",
+}
+
+def _theme_styles(style):
+    """Resolve a style to (owner getter, attribute, color) triples for every theme"""
+    styles = {}
+    for theme, colors in THEME_COLORS.items():
+        styles[theme] = []
+        for path, key in style.items():
+            owner, _, attr = path.rpartition(".")
+            get_owner = attrgetter(owner) if owner else (lambda p: p)
+            styles[theme].append((get_owner, attr, colors[key]))
+    return styles
+
+THEME_STYLES = _theme_styles(CHART_STYLE)
+MAIN_THEME_STYLES = _theme_styles(MAIN_CHART_STYLE)
+
+# -----------------------
+# Data Loading
+# -----------------------
+
+# Completed daily bars do not change, so downloads are also written to disk
+# per (ticker, period, day) and survive server restarts. Today's bar keeps
+# moving during trading hours, so a file older than CACHE_TTL_SECONDS only
+# supplies the earlier rows and the latest bar is downloaded again.
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "findash")
+
+# Only these columns are used; anything else yfinance returns (Adj Close,
+# Dividends, Stock Splits, ...) is dropped right after download
+PRICE_COLUMNS = ['Date', 'Open', 'High', 'Low', 'Close', 'Volume']
+
+# Yahoo accepts a limited number of symbols per request
+MAX_TICKERS_PER_REQUEST = 20
+MAX_DOWNLOAD_WORKERS = 8
+
+def _download_batch(tickers, period=None, start=None):
+    """Download several tickers in one request and split them per ticker"""
+    # Imported on first download to keep it off the server start-up path
+    import yfinance as yf
+    
+    raw = yf.download(" ".join(tickers), period=period, start=start, group_by="ticker",
+                      threads=True, progress=False)
+    frames = {}
+    if raw.empty:
+        return frames
+    
+    grouped = isinstance(raw.columns, pd.MultiIndex)
+    if grouped:
+        available = set(raw.columns.get_level_values(0))
+    
+    for ticker in tickers:
+        if grouped:
+            if ticker not in available:
+                continue
+            df = raw[ticker]
+        else:
+            df = raw
+        
+        # Tickers with different trading calendars are aligned with NaN rows
+        df = df.dropna(how="all")
+        if df.empty:
+            continue
+        
+        df = df.reset_index()
+        columns = set(df.columns)
+        df = df[[col for col in PRICE_COLUMNS if col in columns]].copy()
+        if not pd.api.types.is_datetime64_any_dtype(df["Date"]):
+            df["Date"] = pd.to_datetime(df["Date"], cache=True)
+        frames[ticker] = df
+    
+    return frames
+
+def _disk_cache_path(ticker, period, day=None):
+    day = day or date.today().isoformat()
+    return os.path.join(CACHE_DIR, f"{ticker}_{period}_{day}.parquet")
+
+def _read_disk_cache(ticker, period):
+    """Today's cached download and the time it was written, or (None, None)"""
+    path = _disk_cache_path(ticker, period)
+    try:
+        return pd.read_parquet(path), os.path.getmtime(path)
+    except Exception:
+        return None, None
+
+def _write_disk_cache(ticker, period, df):
+    """Store today's download, replacing files from earlier days"""
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        for stale in glob.glob(_disk_cache_path(glob.escape(ticker), period, "*")):
+            os.remove(stale)
+        df.to_parquet(_disk_cache_path(ticker, period), index=False)
+    except OSError:
+        pass
+
+def load_data(tickers, period, refresh=False):
+    """Download price history for a list of tickers, served from the cache when fresh"""
+    frames = {}
+    missing = []
+    stale = {}
+    for ticker in tickers:
+        cached = None if refresh else cache_get((ticker, period))
+        if cached is not None:
+            frames[ticker] = cached.copy()
+            continue
+        
+        df, written = (None, None) if refresh else _read_disk_cache(ticker, period)
+        if df is None:
+            missing.append(ticker)
+        elif time.time() - written < CACHE_TTL_SECONDS:
+            cache_put((ticker, period), df)
+            frames[ticker] = df.copy()
+        else:
+            stale[ticker] = df
+    
+    if stale:
+        # Only the latest bars can have changed since the files were written
+        frames.update(load_update(stale, period))
+    
+    if not missing:
+        return frames
+    
+    chunks = [missing[i:i + MAX_TICKERS_PER_REQUEST]
+              for i in range(0, len(missing), MAX_TICKERS_PER_REQUEST)]
+    if len(chunks) == 1:
+        results = [_download_batch(chunks[0], period)]
+    else:
+        with ThreadPoolExecutor(max_workers=MAX_DOWNLOAD_WORKERS) as pool:
+            results = list(pool.map(lambda chunk: _download_batch(chunk, period), chunks))
+    
+    for downloaded in results:
+        for ticker, df in downloaded.items():
+            cache_put((ticker, period), df)
+            _write_disk_cache(ticker, period, df)
+            frames[ticker] = df.copy()
+    
+    return frames
+
+def load_update(loaded, period):
+    """Extend loaded frames with the rows published since their last dates"""
+    # The last bars are fetched again since they may still have been in progress.
+    # One request per chunk covers every ticker from the earliest of those dates.
+    tickers = list(loaded)
+    start = min(df['Date'].iloc[-1] for df in loaded.values()).strftime('%Y-%m-%d')
+    frames = {}
+    for i in range(0, len(tickers), MAX_TICKERS_PER_REQUEST):
+        downloaded = _download_batch(tickers[i:i + MAX_TICKERS_PER_REQUEST], start=start)
+        for ticker in tickers[i:i + MAX_TICKERS_PER_REQUEST]:
+            df = loaded[ticker]
+            new_rows = downloaded.get(ticker)
+            if new_rows is not None:
+                df = pd.concat([df[df['Date'] < new_rows['Date'].iloc[0]], new_rows],
+                               ignore_index=True)
+            
+            cache_put((ticker, period), df)
+            _write_disk_cache(ticker, period, df)
+            frames[ticker] = df.copy()
+    
+    return frames
+
 # -----------------------
 # Financial Calculations
 # -----------------------
@@ -175,49 +359,50 @@ def calculate_technical_indicators(df):
     if df is None or df.empty:
         return df
     
-    # Basic indicators
-    df['SMA_20'] = df['Close'].rolling(window=20).mean()
-    df['SMA_50'] = df['Close'].rolling(window=50).mean()
-    
-    df['EMA_12'] = df['Close'].ewm(span=12, adjust=False).mean()
-    df['EMA_26'] = df['Close'].ewm(span=26, adjust=False).mean()
-    
-    # MACD
-    df['MACD'] = df['EMA_12'] - df['EMA_26']
-    df['MACD_Signal'] = df['MACD'].ewm(span=9, adjust=False).mean()
-    df['MACD_Histogram'] = df['MACD'] - df['MACD_Signal']
-    
-    # RSI
-    delta = df['Close'].diff()
-    gain = (delta.where(delta > 0, 0)).rolling(window=14).mean()
-    loss = (-delta.where(delta < 0, 0)).rolling(window=14).mean()
-    rs = gain / loss
-    df['RSI'] = 100 - (100 / (1 + rs))
-    
-    # Bollinger Bands
-    df['BB_Middle'] = df['Close'].rolling(window=20).mean()
-    bb_std = df['Close'].rolling(window=20).std()
-    df['BB_Upper'] = df['BB_Middle'] + (bb_std * 2)
-    df['BB_Lower'] = df['BB_Middle'] - (bb_std * 2)
+    values = compute_indicators(df['Close'].to_numpy(dtype=np.float64))
+    return attach_indicators(df, values)
+
+def update_technical_indicators(df, previous):
+    """Extend the indicators of previous over the rows refreshed into df"""
+    # Rows before previous's last bar are unchanged; that bar and anything
+    # after it were downloaded again
+    start = int((df['Date'] < previous['Date'].iloc[-1]).sum())
+    if start == 0:
+        return calculate_technical_indicators(df)
     
-    return df
+    values = np.full((len(df), len(INDICATOR_COLUMNS)), np.nan)
+    values[:start] = previous[INDICATOR_COLUMNS].to_numpy()[:start]
+    extend_indicators(df['Close'].to_numpy(dtype=np.float64), values, start)
+    return attach_indicators(df, values)
+
+def attach_indicators(df, values):
+    """Append an indicator table from the kernels to df"""
+    indicators = pd.DataFrame(values, columns=INDICATOR_COLUMNS, index=df.index)
+    # The Bollinger middle band is the 20-day SMA, which is computed only once
+    indicators.insert(INDICATOR_COLUMNS.index('BB_Upper'), 'BB_Middle', indicators['SMA_20'])
+    return pd.concat([df, indicators], axis=1)
 
 # -----------------------
 # Plotting Functions
 # -----------------------
 
-def create_main_chart(df, indicators, theme):
-    """Create main price chart"""
-    colors = THEME_COLORS.get(theme, THEME_COLORS["light"])
-    
+# Columns sent to the browser, shared by the glyphs of every chart and the hover tool
+PRICE_SOURCE_COLUMNS = ['Date', 'Open', 'High', 'Low', 'Close', 'Volume',
+                        'SMA_20', 'EMA_12', 'BB_Upper', 'BB_Lower',
+                        'RSI', 'MACD', 'MACD_Signal', 'MACD_Histogram']
+
+# Indicators drawn on the main chart, keyed by their checkbox label
+MAIN_CHART_INDICATORS = ['SMA/EMA', 'Bollinger Bands']
+
+def create_main_chart(theme):
+    """Create main price chart, bound to price_source"""
     p = figure(
         x_axis_type="datetime",
-        title=f"{current_ticker} - Price Chart",
+        title="Price Chart",
         height=400,
         sizing_mode="stretch_width",
         tools="pan,wheel_zoom,box_zoom,reset,save",
-        background_fill_color=colors["bg"],
-        border_fill_color=colors["bg"],
+        output_backend="webgl",
         toolbar_location="above",
         toolbar_sticky=False
     )
@@ -226,21 +411,12 @@ def create_main_chart(df, indicators, theme):
     p.title.text_font_size = "16pt"
     p.title.text_font_style = "bold"
     p.title.align = "center"
-    p.title.text_color = colors["text"]
     
     p.xaxis.axis_label = "Date"
     p.yaxis.axis_label = "Price (USD)"
     p.xaxis.axis_label_text_font_style = "bold"
     p.yaxis.axis_label_text_font_style = "bold"
     
-    p.xaxis.major_label_text_color = colors["text"]
-    p.yaxis.major_label_text_color = colors["text"]
-    p.xaxis.axis_label_text_color = colors["text"]
-    p.yaxis.axis_label_text_color = colors["text"]
-    p.xaxis.axis_line_color = colors["text"]
-    p.yaxis.axis_line_color = colors["text"]
-    
-    p.grid.grid_line_color = colors["grid"]
     p.grid.grid_line_alpha = 0.3
     
     # Add hover tool
@@ -263,122 +439,202 @@ def create_main_chart(df, indicators, theme):
     p.add_tools(crosshair)
     
     # Plot price line
-    price_color = "#2E86AB" if theme in ["light", "terminal"] else "#4ECDC4"
-    p.line(df['Date'], df['Close'], line_width=3, 
-           color=price_color, alpha=0.8, legend_label="Close Price")
-    
-    # Add technical indicators
-    if 'SMA/EMA' in indicators:
-        p.line(df['Date'], df['SMA_20'], line_width=2, 
-               color="#FF6B6B", alpha=0.7, legend_label="SMA 20")
-        p.line(df['Date'], df['EMA_12'], line_width=2, 
-               color="#F18F01", alpha=0.7, legend_label="EMA 12")
-    
-    if 'Bollinger Bands' in indicators and all(col in df.columns for col in ['BB_Upper', 'BB_Lower']):
-        band_x = np.append(df['Date'].values, df['Date'].values[::-1])
-        band_y = np.append(df['BB_Upper'].values, df['BB_Lower'].values[::-1])
-        p.patch(band_x, band_y, color="#2E86AB", alpha=0.1, legend_label="Bollinger Band")
-        p.line(df['Date'], df['BB_Upper'], line_width=1, color="#2E86AB", alpha=0.5)
-        p.line(df['Date'], df['BB_Lower'], line_width=1, color="#2E86AB", alpha=0.5)
+    p.line(x='Date', y='Close', source=price_source, line_width=3,
+           alpha=0.8, legend_label="Close Price", name="close")
+    
+    # Add technical indicators, shown or hidden by create_dashboard
+    p.line(x='Date', y='SMA_20', source=price_source, line_width=2,
+           color="#FF6B6B", alpha=0.7, legend_label="SMA 20", name="SMA/EMA")
+    p.line(x='Date', y='EMA_12', source=price_source, line_width=2,
+           color="#F18F01", alpha=0.7, legend_label="EMA 12", name="SMA/EMA")
+    
+    p.varea(x='Date', y1='BB_Lower', y2='BB_Upper', source=price_source, color="#2E86AB",
+            alpha=0.1, legend_label="Bollinger Band", name="Bollinger Bands")
+    p.line(x='Date', y='BB_Upper', source=price_source, line_width=1,
+           color="#2E86AB", alpha=0.5, name="Bollinger Bands")
+    p.line(x='Date', y='BB_Lower', source=price_source, line_width=1,
+           color="#2E86AB", alpha=0.5, name="Bollinger Bands")
     
     # Add current price line
-    if len(df) > 0:
-        last_price = df['Close'].iloc[-1]
-        price_line = Span(location=last_price, dimension='width', 
-                          line_color='#FF6B6B', line_width=1, line_dash='dashed')
-        p.add_layout(price_line)
-        
-        # Add price label
-        price_label = Label(x=df['Date'].iloc[-1], y=last_price, 
-                            text=f'${last_price:.2f}', 
-                            text_color='#FF6B6B', text_font_size='10pt',
-                            x_offset=10, y_offset=5)
-        p.add_layout(price_label)
+    price_line = Span(location=0, dimension='width', visible=False,
+                      line_color='#FF6B6B', line_width=1, line_dash='dashed',
+                      name="last_price_line")
+    p.add_layout(price_line)
+    
+    # Add price label
+    price_label = Label(x=0, y=0, text='', visible=False,
+                        text_color='#FF6B6B', text_font_size='10pt',
+                        x_offset=10, y_offset=5, name="last_price_label")
+    p.add_layout(price_label)
     
     p.legend.location = "top_left"
     p.legend.click_policy = "hide"
-    p.legend.background_fill_color = colors["widget_bg"]
-    p.legend.label_text_color = colors["text"]
-    p.legend.border_line_color = colors["grid"]
     p.legend.background_fill_alpha = 0.8
     p.legend.border_line_alpha = 0.5
     
+    style_main_chart(p, theme)
+    
     return p
 
-def create_volume_chart(df, theme, x_range=None):
-    """Create volume chart"""
-    colors = THEME_COLORS.get(theme, THEME_COLORS["light"])
+def _apply_theme(p, styles):
+    """Set the (owner getter, attribute, color) triples of a theme style on p"""
+    for get_owner, attr, color in styles:
+        setattr(get_owner(p), attr, color)
+
+def style_main_chart(p, theme):
+    """Apply theme colors to the main price chart"""
+    _apply_theme(p, MAIN_THEME_STYLES.get(theme, MAIN_THEME_STYLES["light"]))
+    
+    price_color = "#2E86AB" if theme in ["light", "terminal"] else "#4ECDC4"
+    p.select_one({"name": "close"}).glyph.line_color = price_color
+
+def show_indicators(indicators):
+    """Toggle the main chart's indicator glyphs and the indicator sub-charts"""
+    for label in MAIN_CHART_INDICATORS:
+        for renderer in main_chart.select(name=label):
+            renderer.visible = label in indicators
+    # Only indicator legend entries follow the checkboxes, not the close price
+    for item in main_chart.legend.items:
+        names = {renderer.name for renderer in item.renderers}
+        if names and names <= set(MAIN_CHART_INDICATORS):
+            item.visible = not names.isdisjoint(indicators)
+
+    rsi_chart.visible = "RSI" in indicators
+    macd_chart.visible = "MACD" in indicators
+
+# Loaded prices and indicators stay float64, as float32 cannot hold the cents
+# of high-priced tickers (its spacing near $700k is 0.0625) for the stats and
+# exports. Only the arrays sent to the browser are narrowed, where that error
+# is far below a pixel.
+def to_plot_array(values):
+    """Convert a column for plotting; float64 is narrowed to float32 to halve the payload"""
+    values = np.asarray(values)
+    if values.dtype == np.float64:
+        return values.astype(np.float32)
+    return values
+
+# Longer histories are downsampled before plotting; LTTB keeps the shape of
+# the price line while the browser draws far fewer points
+MAX_PLOT_POINTS = 2000
+
+def downsample_for_plot(df, dates):
+    """Reduce a long frame and its plot dates to MAX_PLOT_POINTS rows chosen by LTTB"""
+    if len(df) <= MAX_PLOT_POINTS:
+        return df, dates
+    
+    idx = lttb_indices(dates, df['Close'].to_numpy(dtype=np.float64), MAX_PLOT_POINTS)
+    plot_df = df.iloc[idx].copy()
+    
+    # Each kept bar shows the largest volume of the rows it stands for
+    if 'Volume' in df.columns:
+        plot_df['Volume'] = np.maximum.reduceat(df['Volume'].to_numpy(), idx)
+    return plot_df, dates[idx]
+
+def to_plot_dates(dates):
+    """Convert dates to float64 milliseconds since epoch, as BokehJS expects"""
+    return dates.to_numpy(dtype="datetime64[ms]").view(np.int64).astype(np.float64)
+
+def update_price_source(df, dates):
+    """Replace the data behind all charts in a single update"""
+    columns = set(df.columns)
+    data = {col: to_plot_array(df[col]) for col in PRICE_SOURCE_COLUMNS if col in columns}
+    data['Date'] = dates
+    
+    price_source.data = data
     
-    # Color bars based on price movement
-    if 'Open' in df.columns and 'Close' in df.columns:
-        df['Color'] = np.where(df['Close'] >= df['Open'], colors["up"], colors["down"])
+    # Split bars into rising and falling glyphs based on price movement
+    if 'Open' in data and 'Close' in data:
+        price_rising.booleans = data['Close'] >= data['Open']
+    else:
+        price_rising.booleans = np.ones(len(dates), dtype=bool)
+    if 'MACD_Histogram' in data:
+        macd_rising.booleans = data['MACD_Histogram'] >= 0
     else:
-        df['Color'] = colors["up"]
+        macd_rising.booleans = np.ones(len(dates), dtype=bool)
+
+def update_main_chart(df, dates, ticker):
+    """Update the main chart's title and last price for new data"""
+    main_chart.title.text = f"{ticker} - Price Chart"
     
+    # Update current price line and label
+    price_line = main_chart.select_one({"name": "last_price_line"})
+    price_label = main_chart.select_one({"name": "last_price_label"})
+    if len(df) > 0:
+        last_price = df['Close'].iloc[-1]
+        price_line.location = last_price
+        price_label.x = dates[-1]
+        price_label.y = last_price
+        price_label.text = f'${last_price:.2f}'
+    price_line.visible = price_label.visible = len(df) > 0
+
+def create_volume_chart(theme, x_range=None):
+    """Create volume chart, bound to price_source"""
     # Create figure
     p = figure(
         x_axis_type="datetime",
         height=150,
         sizing_mode="stretch_width",
         tools="",
-        background_fill_color=colors["bg"],
-        border_fill_color=colors["bg"]
+        output_backend="webgl"
     )
     
     # Set x_range if provided
     if x_range is not None:
         p.x_range = x_range
     
-    p.vbar(x=df['Date'], top=df['Volume'], width=timedelta(days=0.8),
-           color=df['Color'], alpha=0.7)
+    # One glyph per direction, each with a single color set by the theme
+    p.vbar(x='Date', top='Volume', source=price_source, view=CDSView(filter=price_rising),
+           width=timedelta(days=0.8), alpha=0.7, name="rising")
+    p.vbar(x='Date', top='Volume', source=price_source, view=CDSView(filter=~price_rising),
+           width=timedelta(days=0.8), alpha=0.7, name="falling")
     
     p.yaxis.axis_label = "Volume"
     p.xaxis.axis_label = None
-    
-    # Style
-    p.grid.grid_line_color = colors["grid"]
     p.grid.grid_line_alpha = 0.2
-    p.yaxis.major_label_text_color = colors["text"]
-    p.yaxis.axis_label_text_color = colors["text"]
-    p.yaxis.axis_line_color = colors["text"]
+    
+    style_sub_chart(p, theme)
     
     return p
 
-def create_technical_chart(df, indicator_type, theme, x_range=None):
-    """Create technical indicator sub-charts"""
-    colors = THEME_COLORS.get(theme, THEME_COLORS["light"])
-    
+def create_technical_chart(indicator_type, theme, x_range=None):
+    """Create a technical indicator sub-chart, bound to price_source"""
     p = figure(
         x_axis_type="datetime",
         height=200,
         sizing_mode="stretch_width",
         tools="",
-        background_fill_color=colors["bg"],
-        border_fill_color=colors["bg"]
+        output_backend="webgl"
     )
     
     # Set x_range if provided
     if x_range is not None:
         p.x_range = x_range
     
-    if indicator_type == "RSI" and 'RSI' in df.columns:
-        p.line(df['Date'], df['RSI'], line_width=2, color="#9b59b6")
+    if indicator_type == "RSI":
+        p.line(x='Date', y='RSI', source=price_source, line_width=2, color="#9b59b6")
         
         # Add RSI bands
-        p.line(df['Date'], [70]*len(df), line_color="red", line_dash="dashed", line_width=1)
-        p.line(df['Date'], [30]*len(df), line_color="green", line_dash="dashed", line_width=1)
+        p.add_layout(Span(location=70, dimension='width', line_color="red",
+                          line_dash="dashed", line_width=1))
+        p.add_layout(Span(location=30, dimension='width', line_color="green",
+                          line_dash="dashed", line_width=1))
         
         p.yaxis.axis_label = "RSI"
         p.y_range = Range1d(0, 100)
     
-    elif indicator_type == "MACD" and all(col in df.columns for col in ['MACD', 'MACD_Signal', 'MACD_Histogram']):
-        p.line(df['Date'], df['MACD'], line_width=2, color="#3498db", legend_label="MACD")
-        p.line(df['Date'], df['MACD_Signal'], line_width=2, color="#e74c3c", legend_label="Signal")
+    elif indicator_type == "MACD":
+        p.line(x='Date', y='MACD', source=price_source, line_width=2,
+               color="#3498db", legend_label="MACD")
+        p.line(x='Date', y='MACD_Signal', source=price_source, line_width=2,
+               color="#e74c3c", legend_label="Signal")
         
         # Histogram
-        colors_hist = np.where(df['MACD_Histogram'] >= 0, "#2ecc71", "#e74c3c")
-        p.vbar(x=df['Date'], top=df['MACD_Histogram'], width=timedelta(days=0.6),
-               color=colors_hist, alpha=0.6)
+        p.vbar(x='Date', top='MACD_Histogram', source=price_source,
+               view=CDSView(filter=macd_rising), width=timedelta(days=0.6),
+               color="#2ecc71", alpha=0.6)
+        p.vbar(x='Date', top='MACD_Histogram', source=price_source,
+               view=CDSView(filter=~macd_rising), width=timedelta(days=0.6),
+               color="#e74c3c", alpha=0.6)
         
         p.yaxis.axis_label = "MACD"
         p.legend.location = "top_left"
@@ -387,17 +643,22 @@ def create_technical_chart(df, indicator_type, theme, x_range=None):
         # Create empty chart with label
         p.yaxis.axis_label = indicator_type
     
-    # Style
-    p.grid.grid_line_color = colors["grid"]
     p.grid.grid_line_alpha = 0.2
-    p.yaxis.major_label_text_color = colors["text"]
-    p.yaxis.axis_label_text_color = colors["text"]
-    p.xaxis.major_label_text_color = colors["text"]
-    p.yaxis.axis_line_color = colors["text"]
-    p.xaxis.axis_line_color = colors["text"]
+    
+    style_sub_chart(p, theme)
     
     return p
 
+def style_sub_chart(p, theme):
+    """Apply theme colors to a volume or indicator sub-chart"""
+    _apply_theme(p, THEME_STYLES.get(theme, THEME_STYLES["light"]))
+    
+    colors = THEME_COLORS.get(theme, THEME_COLORS["light"])
+    for renderer in p.select(name="rising"):
+        renderer.glyph.fill_color = renderer.glyph.line_color = colors["up"]
+    for renderer in p.select(name="falling"):
+        renderer.glyph.fill_color = renderer.glyph.line_color = colors["down"]
+
 # -----------------------
 # Dashboard Components
 # -----------------------
@@ -434,7 +695,7 @@ ticker_input = TextInput(
 timeframe = Select(
     title="⏰ Timeframe",
     value="3mo",
-    options=["1mo", "3mo", "6mo", "1y", "2y", "5y"],
+    options=["1mo", "3mo", "6mo", "1y", "2y", "5y", "10y", "max"],
     width=200
 )
 
@@ -460,18 +721,72 @@ status_panel = PreText(text="Ready for analysis...",
                              "font-family": "monospace",
                              "font-size": "12px"})
 
+# Last lines of the status panel; older lines drop off the front
+status_log = deque(status_panel.text.split('\n'), maxlen=8)
+
 # Stats display
 stats_display = Div(text="", width=300)
 
 # Dashboard container
 dashboard_container = column(sizing_mode="stretch_both")
 
+# All charts share one data source; the charts are built once and each
+# analysis only replaces the source's data
+price_source = ColumnDataSource(
+    data={col: [] for col in PRICE_SOURCE_COLUMNS}
+)
+# Rows where the close is at or above the open, and where the MACD histogram
+# is non-negative; the bar charts draw these and their inverse separately
+price_rising = BooleanFilter(booleans=[])
+macd_rising = BooleanFilter(booleans=[])
+main_chart = create_main_chart(current_theme)
+volume_chart = create_volume_chart(current_theme, main_chart.x_range)
+rsi_chart = create_technical_chart("RSI", current_theme, main_chart.x_range)
+macd_chart = create_technical_chart("MACD", current_theme, main_chart.x_range)
+sub_charts = [volume_chart, rsi_chart, macd_chart]
+
+# Hidden indicator charts drop out of the grid, so toggling them is a
+# visibility change rather than a new layout
+dashboard_grid = gridplot([main_chart] + sub_charts, ncols=1, sizing_mode="stretch_width",
+                          merge_tools=True, toolbar_location="above")
+
 # -----------------------
 # Callbacks and Logic
 # -----------------------
 
 current_ticker = "AAPL"
+current_period = None
 current_data = None
+# Plot dates of current_data, converted once per load
+current_dates = None
+
+# This session's latest download; results of earlier ones are discarded.
+# Like all of app.py's globals it is per session, while the pool that runs
+# the downloads is shared by the whole server.
+pending_download = None
+
+# Bursts of clicks on the theme and indicator controls are applied once,
+# for the last click, after the controls have been still this long
+DEBOUNCE_MS = 200
+
+def _debounce(handler, delay_ms=DEBOUNCE_MS):
+    """Wrap an on_change handler to run only after delay_ms without further changes"""
+    pending = None
+    
+    def debounced(attr, old, new):
+        nonlocal pending
+        doc = curdoc()
+        if pending is not None:
+            doc.remove_timeout_callback(pending)
+        
+        def run():
+            nonlocal pending
+            pending = None
+            handler(attr, old, new)
+        
+        pending = doc.add_timeout_callback(run, delay_ms)
+    
+    return debounced
 
 def update_theme(attr, old, new):
     """Update application theme"""
@@ -481,8 +796,24 @@ def update_theme(attr, old, new):
     curdoc().theme = PRO_THEMES[current_theme]
     update_status(f"Theme changed to {current_theme.capitalize()} Mode", "info")
     
-    # Update widget styles
-    update_widget_styles()
+    # Restyle the existing charts in place rather than rebuilding them, and
+    # send all the property changes to the browser together
+    doc = curdoc()
+    doc.hold('combine')
+    try:
+        style_main_chart(main_chart, current_theme)
+        for chart in sub_charts:
+            style_sub_chart(chart, current_theme)
+        
+        # Update widget styles
+        update_widget_styles()
+    finally:
+        doc.unhold()
+
+def update_indicators(attr, old, new):
+    """Apply indicator selection to the loaded data without re-downloading"""
+    # Every indicator is always drawn, only its visibility changes
+    show_indicators([indicator_groups.labels[i] for i in new])
 
 def update_widget_styles():
     """Update widget colors based on theme"""
@@ -508,12 +839,8 @@ def update_status(message, level="info"):
     timestamp = datetime.now().strftime("%H:%M:%S")
     new_line = f"[{timestamp}] {message}"
     
-    # Keep last 8 lines
-    lines = status_panel.text.split('\n')
-    if len(lines) > 8:
-        lines = lines[-7:]
-    
-    status_panel.text = '\n'.join(lines + [new_line])
+    status_log.append(new_line)
+    status_panel.text = '\n'.join(status_log)
     
     # Update style for error/success
     if level == "error":
@@ -529,88 +856,146 @@ def update_status(message, level="info"):
             "color": "#28a745"
         }
 
-def analyze_stock():
+def parse_tickers():
+    """Ticker symbols from the input, which accepts a comma-separated list"""
+    symbols = (symbol.strip().upper() for symbol in ticker_input.value.split(","))
+    return list(dict.fromkeys(symbol for symbol in symbols if symbol))
+
+def analyze_stock(refresh=False):
     """Main analysis function"""
-    global current_ticker, current_data
-    
-    ticker = ticker_input.value.strip().upper()
-    if not ticker:
+    tickers = parse_tickers()
+    if not tickers:
         update_status("Please enter a valid ticker symbol", "error")
         return
     
-    update_status(f"Loading data for {ticker}...", "info")
+    # All symbols are fetched in one batched request; the first is charted
+    update_status(f"Loading data for {', '.join(tickers)}...", "info")
+    start_download(tickers, timeframe.value, load_data, tickers, timeframe.value, refresh)
+
+def start_download(tickers, period, fn, *args, previous=None):
+    """Run a download on the server's worker pool and finish the analysis afterwards"""
+    global pending_download
+    
+    # A newer request from this session supersedes its previous one: cancel
+    # it if it is still queued, otherwise its result is ignored when it
+    # arrives. Other sessions' downloads in the pool are left alone.
+    if pending_download is not None:
+        pending_download.cancel()
     
+    # Download on a worker thread so the server stays responsive, then hand
+    # the result back to this session's document on its next tick
+    doc = curdoc()
+    future = pending_download = download_executor.submit(fn, *args)
+    future.add_done_callback(
+        lambda f: doc.add_next_tick_callback(partial(finish_analysis, f, tickers, period, previous))
+    )
+
+def summarize_ticker(ticker, df):
+    """One-line last price and daily change for the log"""
+    close = df['Close'].to_numpy()
+    change = (close[-1] / close[-2] - 1) * 100 if len(close) > 1 else 0
+    return f"{ticker}: ${close[-1]:.2f} ({change:+.2f}%)"
+
+def finish_analysis(future, tickers, period, previous=None):
+    """Build the dashboard from a completed download"""
+    global current_ticker, current_period, current_data, current_dates, pending_download
+    
+    if future is not pending_download:
+        return
+    pending_download = None
+    
+    # Send the status, stats and chart changes to the browser together
+    doc = curdoc()
+    doc.hold('combine')
     try:
-        # Load data
-        df = yf.download(ticker, period=timeframe.value, progress=False)
-        
-        if df.empty:
-            update_status(f"No data found for {ticker}", "error")
+        frames = future.result()
+        # The first symbol that has data is charted, even if earlier ones have none
+        ticker = next((symbol for symbol in tickers if symbol in frames), None)
+        if ticker is None:
+            update_status(f"No data found for {', '.join(tickers)}", "error")
             return
+        df = frames[ticker]
         
-        # Process data
-        df.columns = [col[0] if isinstance(col, tuple) else col for col in df.columns]
-        df.reset_index(inplace=True)
-        df["Date"] = pd.to_datetime(df["Date"])
-        
-        # Calculate indicators
-        df = calculate_technical_indicators(df)
+        # Calculate indicators, only for new rows when refreshing loaded data
+        if previous is not None:
+            df = update_technical_indicators(df, previous)
+        else:
+            df = calculate_technical_indicators(df)
         current_data = df
+        current_dates = to_plot_dates(df['Date'])
         current_ticker = ticker
+        current_period = period
         
         # Create dashboard
-        create_dashboard(df)
+        create_dashboard(df, current_dates)
         
         # Update stats
         update_stats_display(df, ticker)
         
+        # Remaining symbols are summarised; they are cached for their own analysis
+        for other in tickers:
+            if other == ticker:
+                continue
+            if other in frames:
+                update_status(summarize_ticker(other, frames[other]), "info")
+            else:
+                update_status(f"No data found for {other}", "warning")
+        
         update_status(f"Analysis complete for {ticker}", "success")
         
     except Exception as e:
         update_status(f"Error: {str(e)}", "error")
         print(f"Detailed error: {e}")
+    finally:
+        doc.unhold()
 
-def create_dashboard(df):
-    """Create comprehensive dashboard"""
-    dashboard_container.children.clear()
-    
-    # Get selected indicators
-    selected_indicators = []
+def create_dashboard(df, dates):
+    """Show df on the dashboard's charts"""
     active_labels = [indicator_groups.labels[i] for i in indicator_groups.active]
     
-    # Create main chart
-    main_chart = create_main_chart(df, active_labels, current_theme)
-    
-    # Create volume chart
-    volume_chart = create_volume_chart(df, current_theme, main_chart.x_range)
+    df, dates = downsample_for_plot(df, dates)
     
-    # Create technical charts
-    tech_charts = []
-    if "RSI" in active_labels:
-        tech_charts.append(create_technical_chart(df, "RSI", current_theme, main_chart.x_range))
-    if "MACD" in active_labels:
-        tech_charts.append(create_technical_chart(df, "MACD", current_theme, main_chart.x_range))
-    
-    # Arrange all charts
-    all_charts = [main_chart, volume_chart] + tech_charts
-    grid = gridplot(all_charts, ncols=1, sizing_mode="stretch_width", 
-                   merge_tools=True, toolbar_location="above")
-    
-    dashboard_container.children.append(grid)
+    # Recompute the document's model graph once, after all changes below
+    with curdoc().models.freeze():
+        # Every chart reads from the same source
+        update_price_source(df, dates)
+        
+        # Update main chart
+        update_main_chart(df, dates, current_ticker)
+        show_indicators(active_labels)
+        
+        # The charts are shown once the first analysis has data for them
+        if not dashboard_container.children:
+            dashboard_container.children.append(dashboard_grid)
 
 def update_stats_display(df, ticker):
     """Update statistics display"""
     if df is None or df.empty:
         return
     
-    latest = df.iloc[-1]
+    # Plain scalars of the last row, looked up without pandas indexing
+    latest = df.iloc[-1].to_dict()
+    close = df['Close'].to_numpy()
+    avg_volume = np.nanmean(df['Volume'].to_numpy(dtype=np.float64))
     colors = THEME_COLORS.get(current_theme, THEME_COLORS["light"])
     
-    if len(df) > 1:
-        price_change = ((latest['Close'] - df.iloc[-2]['Close']) / df.iloc[-2]['Close']) * 100
+    if len(close) > 1:
+        price_change = ((close[-1] - close[-2]) / close[-2]) * 100
     else:
         price_change = 0
     
+    rsi_value = latest.get('RSI')
+    if pd.isna(rsi_value):
+        rsi_text, rsi_state = "N/A", "N/A"
+    else:
+        rsi_text = f"{rsi_value:.1f}"
+        if rsi_value > 70:
+            rsi_state = "Overbought"
+        elif rsi_value < 30:
+            rsi_state = "Oversold"
+        else:
+            rsi_state = "Neutral"
+    
     price_color = "#28a745" if price_change >= 0 else "#dc3545"
     
     stats_html = f"""
@@ -642,29 +1027,16 @@ def update_stats_display(df, ticker):
                 <span style="color: {colors['text']}">
                     {latest.get('Volume', 0):,}
                 </span><br>
-                <small style="color: {colors['text']}">Avg: {df['Volume'].mean():,.0f}</small>
+                <small style="color: {colors['text']}">Avg: {avg_volume:,.0f}</small>
             </div>
             
             <div>
                 <strong style="color: {colors['text']};">RSI (14):</strong><br>
                 <span style="color: {colors['text']}">
-                    {latest.get('RSI', 'N/A'):.1f if isinstance(latest.get('RSI'), (int, float)) else 'N/A'}
+                    {rsi_text}
                 </span><br>
                 <small style="color: {colors['text']}">
-    """
-    
-    rsi_value = latest.get('RSI')
-    if isinstance(rsi_value, (int, float)):
-        if rsi_value > 70:
-            stats_html += "Overbought"
-        elif rsi_value < 30:
-            stats_html += "Oversold"
-        else:
-            stats_html += "Neutral"
-    else:
-        stats_html += "N/A"
-    
-    stats_html += f"""
+                    {rsi_state}
                 </small>
             </div>
         </div>
@@ -677,20 +1049,47 @@ def update_stats_display(df, ticker):
     
     stats_display.text = stats_html
 
-def export_to_csv():
+# Exports are written as parquet; "csv" writes a text file through pyarrow
+EXPORT_FORMAT = "parquet"
+
+# Below this magnitude float32 is within half a cent; columns with larger
+# values, such as the prices of high-priced tickers, are exported as float64
+FLOAT32_EXPORT_LIMIT = 2.0 ** 16
+
+def export_data_file():
+    """Write the loaded data and its indicators to a timestamped file"""
     if current_data is not None:
-        filename = f"{current_ticker}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
-        current_data.to_csv(filename, index=False)
+        data = current_data.astype({
+            col: np.float32 for col in current_data.columns
+            if current_data[col].dtype == np.float64
+            and current_data[col].abs().max() < FLOAT32_EXPORT_LIMIT
+        })
+        filename = f"{current_ticker}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.{EXPORT_FORMAT}"
+        if EXPORT_FORMAT == "parquet":
+            data.to_parquet(filename, engine="pyarrow", compression="snappy", index=False)
+        else:
+            import pyarrow as pa
+            import pyarrow.csv
+            pyarrow.csv.write_csv(pa.Table.from_pandas(data, preserve_index=False), filename)
         update_status(f"Data exported to {filename}", "success")
 
 def refresh_current():
-    if current_ticker:
-        analyze_stock()
+    tickers = parse_tickers()
+    if current_data is not None and (tickers, timeframe.value) == ([current_ticker], current_period):
+        # Same selection as on screen, only fetch what is new since then
+        update_status(f"Refreshing {current_ticker}...", "info")
+        columns = set(current_data.columns)
+        prices = current_data[[col for col in PRICE_COLUMNS if col in columns]]
+        start_download(tickers, current_period, load_update,
+                       {current_ticker: prices}, current_period, previous=current_data)
+    elif current_ticker:
+        analyze_stock(refresh=True)
 
 # Connect callbacks
-theme_selector.on_change('active', update_theme)
+theme_selector.on_change('active', _debounce(update_theme))
+indicator_groups.on_change('active', _debounce(update_indicators))
 run_analysis.on_click(lambda: analyze_stock())
-export_data.on_click(export_to_csv)
+export_data.on_click(export_data_file)
 refresh_data.on_click(refresh_current)
 
 # -----------------------
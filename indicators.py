@@ -0,0 +1,198 @@
+"""Numba kernels for the dashboard's technical indicators and plotting.
+
+Kept in their own importable module: ``bokeh serve`` executes app.py as a
+dynamic module, which Numba cannot reload compiled functions from.
+"""
+
+import numpy as np
+from numba import njit, types
+
+# Inputs are typed read-only so pandas' read-only views and ordinary
+# writable arrays both match the same compiled signature
+INPUT_ARRAY = types.Array(types.float64, 1, "A", readonly=True)
+
+# Column layout of the indicator table filled by extend_indicators. The
+# Bollinger middle band is the SMA_20 column and is not stored separately.
+INDICATOR_COLUMNS = ['SMA_20', 'SMA_50', 'EMA_12', 'EMA_26', 'MACD', 'MACD_Signal',
+                     'MACD_Histogram', 'RSI', 'BB_Upper', 'BB_Lower']
+N_INDICATORS = len(INDICATOR_COLUMNS)
+(SMA_20, SMA_50, EMA_12, EMA_26, MACD, MACD_SIGNAL, MACD_HISTOGRAM,
+ RSI, BB_UPPER, BB_LOWER) = range(N_INDICATORS)
+
+# Explicit signatures compile eagerly at import, and cache=True stores the
+# result in __pycache__ so later server starts skip compilation entirely.
+@njit(types.void(INPUT_ARRAY, types.float64[:, :], types.int64), cache=True)
+def extend_indicators(close, values, start):
+    """Fill rows start.. of the indicator table from the state at row start - 1
+
+    Rows before start must already hold their indicators. The EMAs resume from
+    their previous values and the windowed indicators from running sums seeded
+    over the trailing window, so the cost is O(window + new rows) instead of
+    O(len(close)).
+    """
+    n = close.shape[0]
+    alpha_12 = 2.0 / 13.0
+    alpha_26 = 2.0 / 27.0
+    alpha_9 = 2.0 / 10.0
+    ema_12 = values[start - 1, EMA_12]
+    ema_26 = values[start - 1, EMA_26]
+    signal = values[start - 1, MACD_SIGNAL]
+    
+    # Running sums as of row start - 1
+    sum_20 = 0.0
+    for j in range(max(0, start - 20), start):
+        sum_20 += close[j]
+    # The Bollinger variance uses sums of deviations from a shift close to
+    # the window's prices, as sum(x^2) - n*mean^2 loses most of its digits
+    # for high prices with small moves. The sums are recomputed from scratch
+    # every 20 rows, so rounding drift cannot build up; the first row below
+    # starts a new shift.
+    anchor = start - 20
+    shift = 0.0
+    dev_20 = 0.0
+    devsq_20 = 0.0
+    sum_50 = 0.0
+    for j in range(max(0, start - 50), start):
+        sum_50 += close[j]
+    # RSI sums of the up and down moves in the window; the move counts are
+    # exact, so a window without moves of one kind resets its sum to zero
+    # instead of keeping the rounding residue of the running subtraction
+    gains = 0.0
+    losses = 0.0
+    n_gains = 0
+    n_losses = 0
+    for j in range(max(1, start - 14), start):
+        delta = close[j] - close[j - 1]
+        if delta > 0:
+            gains += delta
+            n_gains += 1
+        elif delta < 0:
+            losses -= delta
+            n_losses += 1
+    
+    for i in range(start, n):
+        x = close[i]
+        row = values[i]
+        
+        sum_20 += x
+        if i >= 20:
+            sum_20 -= close[i - 20]
+        if i - anchor >= 20:
+            anchor = i
+            shift = x
+            dev_20 = 0.0
+            devsq_20 = 0.0
+            for j in range(max(0, i - 19), i + 1):
+                dev = close[j] - shift
+                dev_20 += dev
+                devsq_20 += dev * dev
+        else:
+            dev = x - shift
+            dev_20 += dev
+            devsq_20 += dev * dev
+            if i >= 20:
+                dev = close[i - 20] - shift
+                dev_20 -= dev
+                devsq_20 -= dev * dev
+        sum_50 += x
+        if i >= 50:
+            sum_50 -= close[i - 50]
+        
+        delta = x - close[i - 1]
+        if delta > 0:
+            gains += delta
+            n_gains += 1
+        elif delta < 0:
+            losses -= delta
+            n_losses += 1
+        if i >= 15:
+            delta = close[i - 14] - close[i - 15]
+            if delta > 0:
+                gains -= delta
+                n_gains -= 1
+            elif delta < 0:
+                losses += delta
+                n_losses -= 1
+        if n_gains == 0:
+            gains = 0.0
+        if n_losses == 0:
+            losses = 0.0
+        
+        ema_12 = (1.0 - alpha_12) * ema_12 + alpha_12 * x
+        ema_26 = (1.0 - alpha_26) * ema_26 + alpha_26 * x
+        macd = ema_12 - ema_26
+        signal = (1.0 - alpha_9) * signal + alpha_9 * macd
+        row[EMA_12] = ema_12
+        row[EMA_26] = ema_26
+        row[MACD] = macd
+        row[MACD_SIGNAL] = signal
+        row[MACD_HISTOGRAM] = macd - signal
+        
+        row[SMA_20] = row[BB_UPPER] = row[BB_LOWER] = np.nan
+        if i >= 19:
+            mean = sum_20 / 20.0
+            std = np.sqrt(max((devsq_20 - dev_20 * dev_20 / 20.0) / 19.0, 0.0))
+            row[SMA_20] = mean
+            row[BB_UPPER] = mean + 2.0 * std
+            row[BB_LOWER] = mean - 2.0 * std
+        row[SMA_50] = sum_50 / 50.0 if i >= 49 else np.nan
+        
+        # The first delta counts as zero, as with pandas' diff().where()
+        row[RSI] = np.nan
+        if i >= 13:
+            if losses > 0:
+                row[RSI] = 100.0 - 100.0 / (1.0 + gains / losses)
+            elif gains > 0:
+                row[RSI] = 100.0
+
+@njit(types.float64[:, :](INPUT_ARRAY), cache=True)
+def compute_indicators(close):
+    """Every indicator for a non-empty close series in a single fused pass"""
+    values = np.empty((close.shape[0], N_INDICATORS))
+    
+    # The EMAs start from the first close; everything windowed is undefined
+    values[0, :] = np.nan
+    values[0, EMA_12] = values[0, EMA_26] = close[0]
+    values[0, MACD] = values[0, MACD_SIGNAL] = values[0, MACD_HISTOGRAM] = 0.0
+    
+    extend_indicators(close, values, 1)
+    return values
+
+@njit(types.int64[:](INPUT_ARRAY, INPUT_ARRAY, types.int64), cache=True)
+def lttb_indices(x, y, n_out):
+    """Row indices of a Largest-Triangle-Three-Buckets downsampling of (x, y)
+
+    The first and last points are always kept; every bucket in between keeps
+    the point forming the largest triangle with the previously kept point and
+    the average of the next bucket, which preserves the visual shape of a line.
+    """
+    n = x.shape[0]
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    
+    out = np.empty(n_out, dtype=np.int64)
+    every = (n - 2) / (n_out - 2)
+    a = 0
+    out[0] = 0
+    for i in range(n_out - 2):
+        avg_start = int(np.floor((i + 1) * every)) + 1
+        avg_end = min(int(np.floor((i + 2) * every)) + 1, n)
+        avg_x = 0.0
+        avg_y = 0.0
+        for j in range(avg_start, avg_end):
+            avg_x += x[j]
+            avg_y += y[j]
+        avg_x /= avg_end - avg_start
+        avg_y /= avg_end - avg_start
+        
+        best = avg_start - 1
+        max_area = -1.0
+        for j in range(int(np.floor(i * every)) + 1, avg_start):
+            area = abs((x[a] - avg_x) * (y[j] - y[a]) - (x[a] - x[j]) * (avg_y - y[a]))
+            if area > max_area:
+                max_area = area
+                best = j
+        out[i + 1] = best
+        a = best
+    out[n_out - 1] = n - 1
+    return out
@@ -0,0 +1,47 @@
+"""State shared by every session of the dashboard server.
+
+``bokeh serve`` executes app.py afresh for each session, so its module
+globals belong to a single browser tab. This importable module is loaded
+once per server process, and anything sessions should share lives here.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+# Worker threads for network I/O, one pool for the whole server
+download_executor = ThreadPoolExecutor(max_workers=8)
+
+# Downloaded frames are kept per (ticker, period) for a few minutes so that
+# re-running the same analysis, from any session, does not hit Yahoo again.
+# The least recently used entries are dropped beyond CACHE_MAX_ENTRIES.
+CACHE_TTL_SECONDS = 300
+CACHE_MAX_ENTRIES = 64
+_data_cache = OrderedDict()
+_data_cache_lock = threading.Lock()
+
+def cache_get(key):
+    """The value cached for key if it is fresher than CACHE_TTL_SECONDS, or None"""
+    with _data_cache_lock:
+        cached = _data_cache.get(key)
+        if cached is None:
+            return None
+        if time.time() - cached[0] >= CACHE_TTL_SECONDS:
+            del _data_cache[key]
+            return None
+        _data_cache.move_to_end(key)
+        return cached[1]
+
+def cache_put(key, value):
+    """Cache value for key from now on, evicting expired and excess entries"""
+    now = time.time()
+    with _data_cache_lock:
+        _data_cache[key] = (now, value)
+        _data_cache.move_to_end(key)
+        expired = [k for k, (written, _) in _data_cache.items()
+                   if now - written >= CACHE_TTL_SECONDS]
+        for k in expired:
+            del _data_cache[k]
+        while len(_data_cache) > CACHE_MAX_ENTRIES:
+            _data_cache.popitem(last=False)
@@ -1 +0,0 @@
-selected_indicators
\ No newline at end of file